@@ -0,0 +1,8 @@
+"""构建 validate_core 加速内核：python setup.py build_ext --inplace"""
+from setuptools import setup
+from Cython.Build import cythonize
+
+setup(
+    name="validate_core",
+    ext_modules=cythonize("validate_core.pyx", language_level=3),
+)
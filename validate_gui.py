@@ -1,73 +1,300 @@
 import tkinter as tk
-from tkinter import ttk, scrolledtext, messagebox, filedialog
+from tkinter import ttk, messagebox, filedialog
 import re
+import threading
+from itertools import compress
 from typing import Union, List
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
 # ===== 常量定义 =====
 WEIGHT = [1, 3, 9, 27, 19, 26, 16, 17, 20, 29, 25, 13, 8, 24, 10, 30, 28]
 BASE_CODE = "0123456789ABCDEFGHJKLMNPQRTUWXY"
-CODE_INDEX_MAP = {char: idx for idx, char in enumerate(BASE_CODE)}
-CREDIT_CODE_PATTERN = re.compile(r'^[0-9A-HJ-NPQRTUWXY]{2}\d{6}[0-9A-HJ-NPQRTUWXY]{10}$')
+# 输入分隔符（逗号、中文逗号、任意空白），整段文本一次扫描
+_SPLIT_RE = re.compile(r'[,，\s]+')
+# 合法字符集（大小写都算合法，免去热路径上的 .upper() 分配），
+# 作为 bytes.translate 的删除表：全部删光说明没有非法字符
+_ALLOWED_BYTES = (BASE_CODE + BASE_CODE.lower()).encode()
+# 字符形式的合法字符集，用于集合差快速找出非法字符
+_ALLOWED_SET = frozenset(BASE_CODE + BASE_CODE.lower())
+
+# 批量校验缓存的状态码：第一遍就记下错误原因，展示时不再重新校验
+STATUS_VALID = 0
+STATUS_BAD_LENGTH = 1
+STATUS_BAD_CHAR = 2
+STATUS_BAD_FORMAT = 3
+STATUS_BAD_PARITY = 4
+
+# 标量路径查找表：ASCII 码 -> BASE_CODE 索引（0xFF 表示非法字符）。
+# 小写字母直接映射到同一索引，校验时不再为 .upper() 复制字符串
+_lut_init = bytearray(b'\xff' * 256)
+for _idx, _char in enumerate(BASE_CODE):
+    _lut_init[ord(_char)] = _idx
+    if _char.isalpha():
+        _lut_init[ord(_char.lower())] = _idx
+_LUT = bytes(_lut_init)
+del _lut_init, _idx, _char
+
+# 运行期代码生成：把 17 个权重常量直接展开进一条表达式，
+# 省掉循环开销和每次迭代的 WEIGHT[i] 下标（循环版参考实现见 _classify）。
+# 调用方需保证前 17 字节均为合法字符
+_parity_src = (
+    "def _parity_unrolled(code_bytes, _lut=_LUT):\n"
+    "    return (31 - ("
+    + " + ".join(f"_lut[code_bytes[{i}]] * {w}" for i, w in enumerate(WEIGHT))
+    + ") % 31) % 31\n"
+)
+_parity_ns = {"_LUT": _LUT}
+exec(_parity_src, _parity_ns)
+_parity_unrolled = _parity_ns["_parity_unrolled"]
+del _parity_src, _parity_ns
+
+# NumPy 批量校验用查找表：ASCII 码 -> BASE_CODE 索引（-1 表示非法字符），
+# 同样兼容小写
+if np is not None:
+    _LUT_NP = np.full(256, -1, np.int8)
+    _LUT_NP[np.frombuffer(BASE_CODE.encode(), np.uint8)] = np.arange(len(BASE_CODE), dtype=np.int8)
+    _LUT_NP[np.frombuffer(BASE_CODE.lower().encode(), np.uint8)] = np.arange(len(BASE_CODE), dtype=np.int8)
+    _W_NP = np.array(WEIGHT, np.int32)
+    # 预乘查找表：_WLUT[i, 字节] = 索引 * WEIGHT[i]，把 17 次乘法换成 17 次取表；
+    # 非法字节填一个大哨兵值，求和后超过哨兵即说明有非法字符
+    _WLUT_SENTINEL = 1 << 20
+    _WLUT = np.full((17, 256), _WLUT_SENTINEL, np.int32)
+    for _i, _w in enumerate(WEIGHT):
+        _WLUT[_i, np.frombuffer(BASE_CODE.encode(), np.uint8)] = np.arange(len(BASE_CODE), dtype=np.int32) * _w
+        _WLUT[_i, np.frombuffer(BASE_CODE.lower().encode(), np.uint8)] = np.arange(len(BASE_CODE), dtype=np.int32) * _w
+    del _i, _w
+    _POS17 = np.arange(17)
+
+# Numba 可用时把逐行校验循环编译成本地代码（cache=True 避免每次启动重新编译）。
+# 每个代码相互独立，同一份循环体再编译一个 parallel=True 版本，
+# 大批量时用 prange 把行循环摊到多核上。
+if np is not None and njit is not None:
+    def _parity_rows(buf, weights, lut, status, parity_out):
+        for row in prange(buf.shape[0]):
+            total = 0
+            bad_char = False
+            bad_digit = False
+            for i in range(17):
+                code_index = lut[buf[row, i]]
+                if code_index < 0:
+                    bad_char = True
+                total += code_index * weights[i]
+            # 第 3~8 位必须是数字（数字索引为 0~9）
+            for i in range(2, 8):
+                if lut[buf[row, i]] > 9:
+                    bad_digit = True
+            check_index = lut[buf[row, 17]]
+            if check_index < 0:
+                bad_char = True
+            parity = (31 - total % 31) % 31
+            parity_out[row] = parity
+            if bad_char:
+                status[row] = STATUS_BAD_CHAR
+            elif bad_digit:
+                status[row] = STATUS_BAD_FORMAT
+            elif check_index != parity:
+                status[row] = STATUS_BAD_PARITY
+            else:
+                status[row] = STATUS_VALID
+
+    _parity_batch_nb = njit(cache=True)(_parity_rows)
+    _parity_batch_nb_par = njit(parallel=True, cache=True, boundscheck=False)(_parity_rows)
+else:
+    _parity_batch_nb = None
+    _parity_batch_nb_par = None
+
+# 小批量走串行内核，避免为几十个代码付线程池启动开销
+_PARALLEL_THRESHOLD = 2000
+# 超过该数量才先去重再校验（小输入去重开销大于收益）
+_DEDUP_THRESHOLD = 256
 
 # ===== 验证函数 =====
 def is_credit_code_simple(credit_code: Union[str, None]) -> bool:
-    """简单的正则校验（格式检查）"""
+    """简单的格式校验（长度、字符集、第 3~8 位数字）"""
     if not credit_code or len(credit_code) != 18:
         return False
-    return bool(CREDIT_CODE_PATTERN.match(credit_code))
+    # 第 3~8 位必须是数字；其余用删除表检查字符集，避免进正则引擎
+    return (credit_code[2:8].isdigit()
+            and not credit_code.encode('ascii', 'replace').translate(None, _ALLOWED_BYTES))
 
 def get_parity_bit(credit_code: str) -> int:
     """计算校验位索引"""
     if len(credit_code) < 17:
         return -1
-    
-    total = 0
-    for i in range(17):
-        char = credit_code[i]
-        code_index = CODE_INDEX_MAP.get(char)
-        if code_index is None:
-            return -1
-        total += code_index * WEIGHT[i]
-    
-    result = 31 - (total % 31)
-    return 0 if result == 31 else result
+
+    code_bytes = credit_code.encode('ascii', 'replace')
+    # 先用删除表确认前 17 位全部合法，再交给展开版内核
+    if code_bytes[:17].translate(None, _ALLOWED_BYTES):
+        return -1
+    return _parity_unrolled(code_bytes)
 
 def is_credit_code(credit_code: Union[str, None]) -> bool:
-    """完整的统一社会信用代码校验"""
-    if not is_credit_code_simple(credit_code):
+    """完整的统一社会信用代码校验
+
+    格式检查与校验位计算融合成对字符串的单次遍历，
+    不再先走一遍格式检查、再走一遍加权求和。
+    """
+    if not credit_code or len(credit_code) != 18:
         return False
-    
-    parity_bit = get_parity_bit(credit_code)
-    if parity_bit < 0:
+
+    lut = _LUT
+    weight = WEIGHT
+    code_bytes = credit_code.encode('ascii', 'replace')
+    total = 0
+    for i in range(17):
+        code_index = lut[code_bytes[i]]
+        if code_index == 0xFF:
+            return False
+        total += code_index * weight[i]
+
+    # 第 3~8 位必须是数字（数字索引为 0~9，上面已排除非法字符）
+    for i in range(2, 8):
+        if lut[code_bytes[i]] > 9:
+            return False
+
+    check_index = lut[code_bytes[17]]
+    if check_index == 0xFF:
         return False
-    
-    return credit_code[17].upper() == BASE_CODE[parity_bit]
+    return check_index == (31 - total % 31) % 31
+
+# 编译版内核（validate_core.pyx，python setup.py build_ext --inplace 生成）
+# 可用时直接覆盖上面两个纯 Python 实现，单代码校验无 JIT 预热即是本地代码
+try:
+    from validate_core import get_parity_bit, is_credit_code
+except ImportError:
+    pass
+
+def _classify(code: str) -> tuple:
+    """单代码诊断，返回 (状态码, 校验位索引)
+
+    状态码为 STATUS_* 常量；校验位索引仅在计算出校验位时有效，否则为 -1。
+    """
+    if len(code) != 18:
+        return STATUS_BAD_LENGTH, -1
+
+    lut = _LUT
+    weight = WEIGHT
+    code_bytes = code.encode('ascii', 'replace')
+    total = 0
+    bad_char = False
+    for i in range(17):
+        code_index = lut[code_bytes[i]]
+        if code_index == 0xFF:
+            bad_char = True
+        else:
+            total += code_index * weight[i]
+    check_index = lut[code_bytes[17]]
+    if bad_char or check_index == 0xFF:
+        return STATUS_BAD_CHAR, -1
+    if not code[2:8].isdigit():
+        return STATUS_BAD_FORMAT, -1
+
+    parity = 31 - (total % 31)
+    if parity == 31:
+        parity = 0
+    if check_index != parity:
+        return STATUS_BAD_PARITY, parity
+    return STATUS_VALID, parity
+
+def _validate_batch_np(codes: List[str]) -> tuple:
+    """NumPy 批量校验，返回与 codes 等长的 (状态码数组, 校验位索引数组)
+
+    把所有 18 位代码拼成一个 (N, 18) 的字节矩阵，
+    用查找表一次性完成字符检查、加权求和与错误分类，
+    避免逐代码的 Python 循环。
+    """
+    status = np.full(len(codes), STATUS_BAD_LENGTH, np.int8)
+    parity_idx = np.full(len(codes), -1, np.int8)
+
+    # 只有长度为 18 的纯 ASCII 代码才参与矩阵计算；
+    # 长度 18 但含非 ASCII 字符的直接记为非法字符
+    rows = []
+    for pos, code in enumerate(codes):
+        if len(code) == 18:
+            if code.isascii():
+                rows.append(pos)
+            else:
+                status[pos] = STATUS_BAD_CHAR
+    if not rows:
+        return status, parity_idx
+
+    buf = np.frombuffer(
+        "".join(codes[pos] for pos in rows).encode("ascii"), np.uint8
+    ).reshape(-1, 18)
+
+    if _parity_batch_nb is not None:
+        kernel = (_parity_batch_nb_par if buf.shape[0] > _PARALLEL_THRESHOLD
+                  else _parity_batch_nb)
+        row_status = np.empty(buf.shape[0], np.int8)
+        row_parity = np.empty(buf.shape[0], np.int8)
+        kernel(buf, _W_NP, _LUT_NP, row_status, row_parity)
+    else:
+        # 一次花式索引同时完成字符检查和加权求和（无乘法）
+        total = _WLUT[_POS17, buf[:, :17]].sum(axis=1)
+        check_index = _LUT_NP[buf[:, 17]]
+        bad_char = (total >= _WLUT_SENTINEL) | (check_index < 0)
+        # 第 3~8 位必须是数字
+        bad_digit = ~((buf[:, 2:8] >= ord('0')) & (buf[:, 2:8] <= ord('9'))).all(axis=1)
+        # 校验位
+        row_parity = ((31 - total % 31) % 31).astype(np.int8)
+        row_status = np.zeros(buf.shape[0], np.int8)
+        # 赋值顺序即错误优先级：校验位 < 格式 < 非法字符
+        row_status[check_index != row_parity] = STATUS_BAD_PARITY
+        row_status[bad_digit] = STATUS_BAD_FORMAT
+        row_status[bad_char] = STATUS_BAD_CHAR
+
+    status[rows] = row_status
+    parity_idx[rows] = row_parity
+    return status, parity_idx
 
 def validate_credit_codes(codes_text: str) -> dict:
     """验证输入的信用代码"""
-    # 解析输入（支持逗号、空格、换行分隔）
-    codes = []
-    for line in codes_text.splitlines():
-        line_codes = [code.strip() for code in re.split(r'[,，\s]+', line) if code.strip()]
-        codes.extend(line_codes)
-    
+    # 解析输入（支持逗号、空格、换行分隔）：整段文本一次正则扫描
+    codes = list(filter(None, _SPLIT_RE.split(codes_text)))
+
     if not codes:
         return {"error": "没有找到有效的信用代码", "valid": [], "invalid": []}
-    
-    # 验证每个代码
-    valid_codes = []
-    invalid_codes = []
-    
-    for code in codes:
-        if is_credit_code(code):
-            valid_codes.append(code)
+
+    # 验证每个代码，顺手缓存无效代码的诊断结果，展示时无需再次校验。
+    # 结果列表用布尔索引 / compress 在 C 层构建，不走逐代码的 append
+    if np is not None:
+        codes_arr = np.array(codes)
+        if len(codes) > _DEDUP_THRESHOLD:
+            # 批量粘贴常含大量重复代码：只校验去重后的代码，
+            # 再用 inverse 索引把结果散射回原顺序
+            uniq, inverse = np.unique(codes_arr, return_inverse=True)
+            uniq_status, uniq_parity = _validate_batch_np(uniq.tolist())
+            status = uniq_status[inverse]
+            parity_idx = uniq_parity[inverse]
         else:
-            invalid_codes.append(code)
-    
+            status, parity_idx = _validate_batch_np(codes)
+
+        invalid_mask = status != STATUS_VALID
+        valid_codes = codes_arr[~invalid_mask].tolist()
+        invalid_codes = codes_arr[invalid_mask].tolist()
+        invalid_info = list(zip(status[invalid_mask].tolist(),
+                                parity_idx[invalid_mask].tolist()))
+    else:
+        info = list(map(_classify, codes))
+        invalid_flags = [code_status != STATUS_VALID for code_status, _ in info]
+        valid_codes = list(compress(codes, (not flag for flag in invalid_flags)))
+        invalid_codes = list(compress(codes, invalid_flags))
+        invalid_info = list(compress(info, invalid_flags))
+
     return {
         "total": len(codes),
         "valid": valid_codes,
         "invalid": invalid_codes,
+        "invalid_info": invalid_info,
         "error": None
     }
 
@@ -114,9 +341,7 @@ class CreditCodeValidatorApp:
         input_tip.pack(anchor=tk.W, pady=(0, 5))
         
         # 输入文本框
-        self.input_text = scrolledtext.ScrolledText(input_frame, width=40, height=20, 
-                                                   font=("Consolas", 10))
-        self.input_text.pack(fill=tk.BOTH, expand=True)
+        self.input_text = self._create_text_area(input_frame)
         
         # 按钮区域
         button_frame = ttk.Frame(main_frame)
@@ -144,33 +369,60 @@ class CreditCodeValidatorApp:
         self.stats_label.pack(anchor=tk.W, pady=(0, 5))
         
         # 输出文本框
-        self.output_text = scrolledtext.ScrolledText(output_frame, width=40, height=20, 
-                                                    font=("Consolas", 10), state=tk.DISABLED)
-        self.output_text.pack(fill=tk.BOTH, expand=True)
+        self.output_text = self._create_text_area(output_frame)
+        self.output_text.config(state=tk.DISABLED)
         
         # 状态栏
         self.status_bar = ttk.Label(main_frame, text="", font=("微软雅黑", 9))
         self.status_bar.grid(row=3, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(5, 0))
-        
+
+    def _create_text_area(self, parent):
+        """创建带手动滚动条的文本框
+
+        wrap=NONE 让大段文本插入时跳过逐行换行重排，
+        关闭撤销缓冲避免批量粘贴时留下整份撤销副本。
+        """
+        frame = ttk.Frame(parent)
+        frame.pack(fill=tk.BOTH, expand=True)
+
+        text = tk.Text(frame, width=40, height=20, font=("Consolas", 10),
+                       wrap=tk.NONE, undo=False, maxundo=0)
+        vbar = ttk.Scrollbar(frame, orient=tk.VERTICAL, command=text.yview)
+        hbar = ttk.Scrollbar(frame, orient=tk.HORIZONTAL, command=text.xview)
+        text.configure(yscrollcommand=vbar.set, xscrollcommand=hbar.set)
+
+        text.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        vbar.grid(row=0, column=1, sticky=(tk.N, tk.S))
+        hbar.grid(row=1, column=0, sticky=(tk.W, tk.E))
+        frame.columnconfigure(0, weight=1)
+        frame.rowconfigure(0, weight=1)
+        return text
+
     def validate_codes(self):
         """验证信用代码"""
         # 获取输入文本
         input_content = self.input_text.get("1.0", tk.END).strip()
-        
+
         if not input_content:
             messagebox.showwarning("警告", "请输入要验证的信用代码")
             return
-        
-        # 开始验证
+
+        # 开始验证：放到工作线程执行，大批量时主循环保持响应
         self.set_status("正在验证...")
         self.validate_btn.config(state=tk.DISABLED)
-        
-        # 验证
+        threading.Thread(target=self._run_validate, args=(input_content,),
+                         daemon=True).start()
+
+    def _run_validate(self, input_content):
+        """工作线程：执行校验，结果经 after 投递回主线程"""
         results = validate_credit_codes(input_content)
-        
+        self.root.after(0, self._on_validate_done, results)
+
+    def _on_validate_done(self, results):
+        """主线程回调：展示校验结果"""
         # 恢复按钮状态
         self.validate_btn.config(state=tk.NORMAL)
-        
+
         if results.get("error"):
             messagebox.showerror("错误", results["error"])
             self.set_status("验证失败")
@@ -195,40 +447,39 @@ class CreditCodeValidatorApp:
         self.output_text.delete("1.0", tk.END)
         
         if results['invalid']:
-            self.output_text.insert(tk.END, "❌ 以下是无效的信用代码：\n")
-            self.output_text.insert(tk.END, "=" * 50 + "\n\n")
-            
-            for i, code in enumerate(results['invalid'], 1):
-                # 分析错误原因
-                error_reason = self.get_error_reason(code)
-                self.output_text.insert(tk.END, f"{i}. {code}\n")
-                self.output_text.insert(tk.END, f"   错误原因: {error_reason}\n\n")
+            # 整份报告拼成一个字符串后一次插入，
+            # 避免每个无效代码跨 3 次 Python<->Tcl 边界并触发重排
+            lines = ["❌ 以下是无效的信用代码：\n", "=" * 50 + "\n\n"]
+            for i, (code, (status, parity_index)) in enumerate(
+                    zip(results['invalid'], results['invalid_info']), 1):
+                # 错误原因在校验时已经缓存，这里只做格式化
+                error_reason = self.get_error_reason(code, status, parity_index)
+                lines.append(f"{i}. {code}\n   错误原因: {error_reason}\n\n")
+            self.output_text.insert(tk.END, "".join(lines))
         else:
             self.output_text.insert(tk.END, "✅ 所有信用代码都有效！\n")
             
         self.output_text.config(state=tk.DISABLED)
         
-    def get_error_reason(self, code):
-        """分析错误原因"""
-        if not code or len(code) != 18:
+    def get_error_reason(self, code, status, parity_index):
+        """根据校验时缓存的状态码格式化错误原因（不再重新校验）"""
+        if status == STATUS_BAD_LENGTH:
             return "长度不是18位"
-        
-        if not is_credit_code_simple(code):
-            # 检查包含的非法字符
-            invalid_chars = []
-            for char in code.upper():
-                if char not in BASE_CODE:
-                    invalid_chars.append(char)
+
+        if status == STATUS_BAD_CHAR:
+            # 一次集合差找出所有非法字符（构造与求差都在 C 层完成）
+            invalid_chars = set(code) - _ALLOWED_SET
             if invalid_chars:
-                return f"包含非法字符: {', '.join(set(invalid_chars))}"
+                return f"包含非法字符: {', '.join(invalid_chars)}"
             return "格式不符合要求"
-        
-        # 校验位错误
-        parity_bit = get_parity_bit(code)
-        if parity_bit >= 0:
-            expected_char = BASE_CODE[parity_bit]
+
+        if status == STATUS_BAD_FORMAT:
+            return "格式不符合要求"
+
+        if status == STATUS_BAD_PARITY:
+            expected_char = BASE_CODE[parity_index]
             return f"校验位错误，应为 '{expected_char}'"
-        
+
         return "未知错误"
         
     def clear_all(self):
@@ -252,22 +503,26 @@ class CreditCodeValidatorApp:
         
         if filename:
             try:
-                with open(filename, 'r', encoding='utf-8') as f:
-                    content = f.read()
                 self.input_text.delete("1.0", tk.END)
-                self.input_text.insert("1.0", content)
+                with open(filename, 'r', encoding='utf-8') as f:
+                    # 分块读入：峰值内存只有一个块大小，
+                    # 块间刷新一次界面，加载大文件时窗口不假死
+                    while chunk := f.read(65536):
+                        self.input_text.insert(tk.END, chunk)
+                        self.root.update_idletasks()
                 self.set_status(f"已加载文件: {filename}")
             except Exception as e:
                 messagebox.showerror("错误", f"加载文件失败: {str(e)}")
                 
     def save_results(self):
         """保存错误结果"""
-        output_content = self.output_text.get("1.0", tk.END).strip()
-        
-        if not output_content or output_content == "✅ 所有信用代码都有效！":
+        # 只看第一行就能判断有没有错误结果，不必复制整份报告
+        first_line = self.output_text.get("1.0", "2.0").strip()
+
+        if not first_line or first_line == "✅ 所有信用代码都有效！":
             messagebox.showinfo("提示", "没有错误结果需要保存")
             return
-            
+
         filename = filedialog.asksaveasfilename(
             title="保存错误结果",
             defaultextension=".txt",
@@ -280,7 +535,10 @@ class CreditCodeValidatorApp:
         if filename:
             try:
                 with open(filename, 'w', encoding='utf-8') as f:
-                    f.write(output_content)
+                    # 按 1000 行一段从控件取出并写入，避免一次性复制整份报告
+                    last_line = int(self.output_text.index(tk.END).split('.')[0])
+                    for line in range(1, last_line, 1000):
+                        f.write(self.output_text.get(f"{line}.0", f"{line + 1000}.0"))
                 self.set_status(f"错误结果已保存到: {filename}")
                 messagebox.showinfo("完成", "错误结果已保存")
             except Exception as e: